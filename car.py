@@ -2,14 +2,157 @@
 Car physics - bicycle model with F1-style rendering
 """
 
+import math
 import pygame
 import numpy as np
 from config import *
+from tick import bicycle_step, bicycle_step_all, tick_all
+
+
+def _body_geometry(L, W):
+    """
+    Build the car outline in the car-local frame (x forward, y right).
+    
+    Returns every vertex packed into one (N, 2) array plus a dict of
+    slices naming each body part, so render can rotate the whole car
+    with a single matrix multiply.
+    """
+    wing_w = W * 1.3
+    fw_w = W * 1.4
+    wheel_w = 5
+    wheel_h = 10
+    
+    parts = {
+        'rear_wing': [
+            (-L/2 - 3, -wing_w/2),
+            (-L/2 - 3, wing_w/2),
+            (-L/2 + 2, wing_w/2 - 2),
+            (-L/2 + 2, -wing_w/2 + 2),
+        ],
+        'body': [
+            (L/2 + 5, 0),
+            (L/2 - 5, W/2 - 4),
+            (L/4, W/2 - 2),
+            (0, W/2),
+            (-L/4, W/2 + 2),
+            (-L/2, W/2 - 2),
+            (-L/2, -W/2 + 2),
+            (-L/4, -W/2 - 2),
+            (0, -W/2),
+            (L/4, -W/2 + 2),
+            (L/2 - 5, -W/2 + 4),
+        ],
+        'cockpit': [
+            (L/6, W/4),
+            (-L/6, W/4),
+            (-L/6, -W/4),
+            (L/6, -W/4),
+        ],
+        'front_wing_l': [
+            (L/2, -fw_w/2),
+            (L/2 + 4, -fw_w/2 - 3),
+            (L/2 + 4, -W/2 + 2),
+            (L/2, -W/2 + 4),
+        ],
+        'front_wing_r': [
+            (L/2, fw_w/2),
+            (L/2 + 4, fw_w/2 + 3),
+            (L/2 + 4, W/2 - 2),
+            (L/2, W/2 - 4),
+        ],
+    }
+    
+    wheel_positions = [
+        (L/3, W/2 + 3),
+        (L/3, -W/2 - 3),
+        (-L/3, W/2 + 3),
+        (-L/3, -W/2 - 3),
+    ]
+    for i, (wx, wy) in enumerate(wheel_positions):
+        parts[f'wheel_{i}'] = [
+            (wx - wheel_h/2, wy - wheel_w/2),
+            (wx + wheel_h/2, wy - wheel_w/2),
+            (wx + wheel_h/2, wy + wheel_w/2),
+            (wx - wheel_h/2, wy + wheel_w/2),
+        ]
+    
+    parts['stripe'] = [
+        (L/2 - 5, 2),
+        (L/2 - 5, -2),
+        (-L/3, -2),
+        (-L/3, 2),
+    ]
+    parts['badge'] = [(-L/6, 0)]
+    
+    points = []
+    slices = {}
+    for name, pts in parts.items():
+        slices[name] = slice(len(points), len(points) + len(pts))
+        points.extend(pts)
+    
+    return np.array(points, dtype=np.float32), slices
+
+
+def _trail_tables(max_trail):
+    """Per-segment trail fade colors and thicknesses, indexed so the newest segment is brightest"""
+    alphas = np.arange(max_trail) / max_trail
+    colors = [tuple(c) for c in (np.array(ACCENT_CYAN) * alphas[:, None]).astype(np.uint8).tolist()]
+    thickness = np.maximum(1, (3 * alphas).astype(np.int32)).tolist()
+    return colors, thickness
+
+
+def _ordered_ring(buf, head, count):
+    """Ring buffer rows oldest to newest, head being the next slot to be written"""
+    if count < buf.shape[0]:
+        return buf[:count]
+    return np.concatenate((buf[head:], buf[:head]))
+
+
+def _draw_trail(screen, points, colors, thickness, bands):
+    """Draw an oldest-to-newest trail as a few fading polylines, returning the touched rect"""
+    n = len(points)
+    offset = len(colors) - n
+    bands = min(bands, n - 1)
+    rects = []
+    for k in range(bands):
+        # Each band shares its endpoints with the next so the line stays connected
+        start = (n - 1) * k // bands
+        end = (n - 1) * (k + 1) // bands
+        mid = offset + (start + end + 1) // 2
+        rects.append(pygame.draw.lines(screen, colors[mid], False, points[start:end + 1], thickness[mid]))
+    return rects[0].unionall(rects[1:])
+
+
+def _draw_steering_indicator(screen, front_x, front_y, steer_deg):
+    """Draw the steering direction line and tip from the front axle, returning the touched rect"""
+    steer_rad = math.radians(steer_deg)
+    line_length = 20
+    end_x = front_x + line_length * math.cos(steer_rad)
+    end_y = front_y + line_length * math.sin(steer_rad)
+    rect = pygame.draw.line(screen, ACCENT_YELLOW, 
+                           (int(front_x), int(front_y)), 
+                           (int(end_x), int(end_y)), 2)
+    return rect.union(pygame.draw.circle(screen, ACCENT_YELLOW, (int(end_x), int(end_y)), 4))
 
 
 class Car:
     """Car with bicycle model physics"""
     
+    # Constant body outline, rotated as one batch per sprite
+    _LOCAL_POINTS, _SLICES = _body_geometry(CAR_LENGTH, CAR_WIDTH)
+    
+    # Half-size of a car sprite: outline radius plus room for shadow and borders
+    _SPRITE_HALF = int(math.ceil(np.hypot(_LOCAL_POINTS[:, 0], _LOCAL_POINTS[:, 1]).max())) + 6
+    
+    # Glow surfaces shared across cars, keyed by body color
+    _glow_cache = {}
+    
+    # Pre-rotated car sprites, keyed by (colors, heading in whole degrees)
+    _sprite_cache = {}
+    
+    # Number of fade bands the trail is drawn in, one polyline each
+    _TRAIL_BANDS = 4
+    
     def __init__(self, x, y, angle):
         self.x = x
         self.y = y
@@ -22,14 +165,104 @@ class Car:
         self.width = CAR_WIDTH
         self.wheelbase = WHEELBASE
         
-        # Trail for visualization
-        self.trail = []
+        # Trail for visualization - fixed-size ring buffer of (x, y, speed)
         self.max_trail = 150
+        self._trail_buf = np.zeros((self.max_trail, 3), dtype=np.float64)
+        self._trail_head = 0
+        self._trail_count = 0
+        
+        # Per-segment fade lookup
+        self._trail_colors, self._trail_thickness = _trail_tables(self.max_trail)
         
         self.body_color = ACCENT_BLUE
         self.accent_color = ACCENT_CYAN
         self.wing_color = (20, 20, 30)
+    
+    @classmethod
+    def _get_glow(cls, color):
+        """Return the static glow surface for a body color, drawing it on first use"""
+        glow = cls._glow_cache.get(color)
+        if glow is None:
+            glow = pygame.Surface((100, 100), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (*color, 40), (50, 50), 40)
+            pygame.draw.circle(glow, (*color, 25), (50, 50), 50)
+            glow = glow.convert_alpha()
+            cls._glow_cache[color] = glow
+        return glow
+    
+    @classmethod
+    def _get_sprite(cls, heading, colors):
+        """Return the car sprite for a whole-degree heading, drawing it on first use"""
+        key = (colors, heading)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            sprite = cls._draw_sprite(heading, *colors)
+            cls._sprite_cache[key] = sprite
+        return sprite
+    
+    @classmethod
+    def _draw_sprite(cls, heading, body_color, accent_color, wing_color):
+        """Draw the car body rotated to heading (degrees) onto a transparent surface"""
+        half = cls._SPRITE_HALF
+        sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+        
+        # Rotate every body vertex in one batch, pivoting on the sprite center
+        heading_rad = math.radians(heading)
+        cos_a = math.cos(heading_rad)
+        sin_a = math.sin(heading_rad)
+        rotation = np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=np.float32)
+        world = cls._LOCAL_POINTS @ rotation.T + half
+        world = world.astype(np.int32)
+        
+        def part(name):
+            return world[cls._SLICES[name]].tolist()
         
+        # Rear wing
+        wing_points = part('rear_wing')
+        pygame.draw.polygon(sprite, wing_color, wing_points)
+        pygame.draw.polygon(sprite, ACCENT_RED, wing_points, 2)
+        
+        # Main body
+        body = world[cls._SLICES['body']]
+        body_points = body.tolist()
+        
+        # Shadow
+        shadow_offset = 3
+        shadow_points = (body + shadow_offset).tolist()
+        pygame.draw.polygon(sprite, (10, 10, 15), shadow_points)
+        
+        pygame.draw.polygon(sprite, body_color, body_points)
+        pygame.draw.polygon(sprite, accent_color, body_points, 2)
+        
+        # Cockpit
+        cockpit_points = part('cockpit')
+        pygame.draw.polygon(sprite, (15, 15, 20), cockpit_points)
+        pygame.draw.polygon(sprite, (40, 40, 50), cockpit_points, 1)
+        
+        # Front wing
+        front_wing_l = part('front_wing_l')
+        front_wing_r = part('front_wing_r')
+        pygame.draw.polygon(sprite, wing_color, front_wing_l)
+        pygame.draw.polygon(sprite, wing_color, front_wing_r)
+        pygame.draw.polygon(sprite, ACCENT_RED, front_wing_l, 1)
+        pygame.draw.polygon(sprite, ACCENT_RED, front_wing_r, 1)
+        
+        # Wheels
+        for i in range(4):
+            wheel_points = part(f'wheel_{i}')
+            pygame.draw.polygon(sprite, (30, 30, 35), wheel_points)
+            pygame.draw.polygon(sprite, (60, 60, 70), wheel_points, 1)
+        
+        # Center stripe
+        pygame.draw.polygon(sprite, accent_color, part('stripe'))
+        
+        # Number badge
+        number_pos = part('badge')[0]
+        pygame.draw.circle(sprite, WHITE, number_pos, 6)
+        
+        # Match the display format once so every blit is a straight copy
+        return sprite.convert_alpha()
+    
     def update(self, steering_input, speed_input=None):
         """
         Update car position using the Kinematic Bicycle Model.
@@ -37,186 +270,201 @@ class Car:
         This model treats the front and rear wheels as single points, 
         providing a realistic simulation of steering geometry.
         """
-        self.steering_angle = np.clip(steering_input, -MAX_STEERING_ANGLE, MAX_STEERING_ANGLE)
-        
-        if speed_input is not None:
-            self.speed = np.clip(speed_input, MIN_SPEED, MAX_SPEED)
+        # Bind globals and attributes used more than once to locals
+        max_steering = MAX_STEERING_ANGLE
+        max_trail = self.max_trail
+        head = self._trail_head
         
-        heading_rad = np.radians(self.angle)
-        steering_rad = np.radians(self.steering_angle)
+        steering = max(-max_steering, min(max_steering, steering_input))
+        self.steering_angle = steering
         
-        # Calculate angular velocity based on wheelbases and steering angle
-        # Formula: w = v / R, where R = wheelbase / tan(steering)
-        if abs(self.steering_angle) > 0.1:
-            turn_radius = self.wheelbase / np.tan(steering_rad)
-            angular_velocity = self.speed / turn_radius
+        if speed_input is not None:
+            speed = max(MIN_SPEED, min(MAX_SPEED, speed_input))
+            self.speed = speed
         else:
-            angular_velocity = 0
-        
-        # Update state variables
-        self.x += self.speed * np.cos(heading_rad)
-        self.y += self.speed * np.sin(heading_rad)
-        self.angle += np.degrees(angular_velocity)
+            speed = self.speed
         
-        # Keep angle within [-180, 180] degrees
-        while self.angle > 180:
-            self.angle -= 360
-        while self.angle < -180:
-            self.angle += 360
+        x, y, angle = bicycle_step(self.x, self.y, self.angle, speed, steering, self.wheelbase)
+        self.x, self.y, self.angle = x, y, angle
         
         # Update position trail for visual effect
-        self.trail.append((self.x, self.y, self.speed))
-        if len(self.trail) > self.max_trail:
-            self.trail.pop(0)
+        self._trail_buf[head] = (x, y, speed)
+        self._trail_head = (head + 1) % max_trail
+        self._trail_count = min(self._trail_count + 1, max_trail)
+    
+    def _ordered_trail(self):
+        """Trail entries oldest to newest as an (n, 3) array"""
+        return _ordered_ring(self._trail_buf, self._trail_head, self._trail_count)
     
     def get_front_position(self):
         """Get front axle position"""
-        heading_rad = np.radians(self.angle)
-        front_x = self.x + (self.length / 2) * np.cos(heading_rad)
-        front_y = self.y + (self.length / 2) * np.sin(heading_rad)
+        heading_rad = math.radians(self.angle)
+        front_x = self.x + (self.length / 2) * math.cos(heading_rad)
+        front_y = self.y + (self.length / 2) * math.sin(heading_rad)
         return front_x, front_y
     
     def render(self, screen):
-        """Draw car and trail"""
+        """Draw car and trail, returning the screen rect that was drawn over"""
         # Draw trail
-        if len(self.trail) > 1:
-            for i in range(1, len(self.trail)):
-                alpha = i / len(self.trail)
-                thickness = max(1, int(3 * alpha))
-                
-                p1 = (int(self.trail[i-1][0]), int(self.trail[i-1][1]))
-                p2 = (int(self.trail[i][0]), int(self.trail[i][1]))
-                
-                color = (
-                    int(ACCENT_CYAN[0] * alpha),
-                    int(ACCENT_CYAN[1] * alpha),
-                    int(ACCENT_CYAN[2] * alpha)
-                )
-                pygame.draw.line(screen, color, p1, p2, thickness)
+        trail_rect = None
+        if self._trail_count > 1:
+            points = self._ordered_trail()[:, :2].astype(np.int32).tolist()
+            trail_rect = _draw_trail(screen, points, self._trail_colors, self._trail_thickness,
+                                     self._TRAIL_BANDS)
         
         # Glow effect
-        glow_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.body_color, 40), (50, 50), 40)
-        pygame.draw.circle(glow_surface, (*self.body_color, 25), (50, 50), 50)
-        screen.blit(glow_surface, (int(self.x) - 50, int(self.y) - 50))
+        rect = screen.blit(self._get_glow(self.body_color), (int(self.x) - 50, int(self.y) - 50))
+        if trail_rect is not None:
+            rect.union_ip(trail_rect)
         
-        # Rotation math
-        heading_rad = np.radians(self.angle)
-        cos_a = np.cos(heading_rad)
-        sin_a = np.sin(heading_rad)
+        # Car body - pre-rendered per degree of heading
+        colors = (self.body_color, self.accent_color, self.wing_color)
+        sprite = self._get_sprite(int(round(self.angle)) % 360, colors)
+        half = self._SPRITE_HALF
+        rect.union_ip(screen.blit(sprite, (int(self.x) - half, int(self.y) - half)))
         
-        def rotate_point(px, py):
-            rx = px * cos_a - py * sin_a + self.x
-            ry = px * sin_a + py * cos_a + self.y
-            return (int(rx), int(ry))
-        
-        L = self.length
-        W = self.width
-        
-        # Rear wing
-        wing_w = W * 1.3
-        wing_points = [
-            rotate_point(-L/2 - 3, -wing_w/2),
-            rotate_point(-L/2 - 3, wing_w/2),
-            rotate_point(-L/2 + 2, wing_w/2 - 2),
-            rotate_point(-L/2 + 2, -wing_w/2 + 2),
-        ]
-        pygame.draw.polygon(screen, self.wing_color, wing_points)
-        pygame.draw.polygon(screen, ACCENT_RED, wing_points, 2)
-        
-        # Main body
-        body_points = [
-            rotate_point(L/2 + 5, 0),
-            rotate_point(L/2 - 5, W/2 - 4),
-            rotate_point(L/4, W/2 - 2),
-            rotate_point(0, W/2),
-            rotate_point(-L/4, W/2 + 2),
-            rotate_point(-L/2, W/2 - 2),
-            rotate_point(-L/2, -W/2 + 2),
-            rotate_point(-L/4, -W/2 - 2),
-            rotate_point(0, -W/2),
-            rotate_point(L/4, -W/2 + 2),
-            rotate_point(L/2 - 5, -W/2 + 4),
-        ]
-        
-        # Shadow
-        shadow_offset = 3
-        shadow_points = [(p[0] + shadow_offset, p[1] + shadow_offset) for p in body_points]
-        pygame.draw.polygon(screen, (10, 10, 15), shadow_points)
-        
-        pygame.draw.polygon(screen, self.body_color, body_points)
-        pygame.draw.polygon(screen, self.accent_color, body_points, 2)
-        
-        # Cockpit
-        cockpit_points = [
-            rotate_point(L/6, W/4),
-            rotate_point(-L/6, W/4),
-            rotate_point(-L/6, -W/4),
-            rotate_point(L/6, -W/4),
-        ]
-        pygame.draw.polygon(screen, (15, 15, 20), cockpit_points)
-        pygame.draw.polygon(screen, (40, 40, 50), cockpit_points, 1)
+        # Steering indicator
+        front_x, front_y = self.get_front_position()
+        rect.union_ip(_draw_steering_indicator(screen, front_x, front_y,
+                                               self.angle + self.steering_angle))
+        return rect
+
+
+class Cars:
+    """
+    Fleet of cars stored as structure-of-arrays.
+    
+    Each state field is one contiguous float32 array over all cars, so the
+    physics runs as a single vectorized (or JIT-compiled) pass instead of
+    one Car object at a time. Use cars[i] for a per-car CarView.
+    """
+    
+    def __init__(self, n, x=0.0, y=0.0, angle=0.0, max_trail=150):
+        self.x = np.full(n, x, dtype=np.float32)
+        self.y = np.full(n, y, dtype=np.float32)
+        self.angle = np.full(n, angle, dtype=np.float32)
+        self.speed = np.full(n, 2.5, dtype=np.float32)
+        self.steering_angle = np.zeros(n, dtype=np.float32)
         
-        # Front wing
-        fw_w = W * 1.4
-        front_wing_l = [
-            rotate_point(L/2, -fw_w/2),
-            rotate_point(L/2 + 4, -fw_w/2 - 3),
-            rotate_point(L/2 + 4, -W/2 + 2),
-            rotate_point(L/2, -W/2 + 4),
-        ]
-        front_wing_r = [
-            rotate_point(L/2, fw_w/2),
-            rotate_point(L/2 + 4, fw_w/2 + 3),
-            rotate_point(L/2 + 4, W/2 - 2),
-            rotate_point(L/2, W/2 - 4),
-        ]
-        pygame.draw.polygon(screen, self.wing_color, front_wing_l)
-        pygame.draw.polygon(screen, self.wing_color, front_wing_r)
-        pygame.draw.polygon(screen, ACCENT_RED, front_wing_l, 1)
-        pygame.draw.polygon(screen, ACCENT_RED, front_wing_r, 1)
+        self.length = CAR_LENGTH
+        self.wheelbase = WHEELBASE
         
-        # Wheels
-        wheel_w = 5
-        wheel_h = 10
-        
-        wheel_positions = [
-            (L/3, W/2 + 3),
-            (L/3, -W/2 - 3),
-            (-L/3, W/2 + 3),
-            (-L/3, -W/2 - 3),
-        ]
+        # Trails - one (x, y, speed) ring buffer per car
+        self.max_trail = max_trail
+        self.trail = np.zeros((n, max_trail, 3), dtype=np.float32)
+        self.trail_head = np.zeros(n, dtype=np.int32)
+        self.trail_count = np.zeros(n, dtype=np.int32)
+        self._trail_colors, self._trail_thickness = _trail_tables(max_trail)
         
-        for wx, wy in wheel_positions:
-            wheel_points = [
-                rotate_point(wx - wheel_h/2, wy - wheel_w/2),
-                rotate_point(wx + wheel_h/2, wy - wheel_w/2),
-                rotate_point(wx + wheel_h/2, wy + wheel_w/2),
-                rotate_point(wx - wheel_h/2, wy + wheel_w/2),
-            ]
-            pygame.draw.polygon(screen, (30, 30, 35), wheel_points)
-            pygame.draw.polygon(screen, (60, 60, 70), wheel_points, 1)
+        self.body_color = ACCENT_BLUE
+        self.accent_color = ACCENT_CYAN
+        self.wing_color = (20, 20, 30)
+    
+    def __len__(self):
+        return self.x.shape[0]
+    
+    def __getitem__(self, i):
+        return CarView(self, i)
+    
+    def update(self, steering_input, speed_input=None):
+        """Advance every car one bicycle-model tick from per-car steering and speed arrays"""
+        np.clip(steering_input, -MAX_STEERING_ANGLE, MAX_STEERING_ANGLE, out=self.steering_angle)
+        if speed_input is not None:
+            np.clip(speed_input, MIN_SPEED, MAX_SPEED, out=self.speed)
         
-        # Center stripe
-        stripe_points = [
-            rotate_point(L/2 - 5, 2),
-            rotate_point(L/2 - 5, -2),
-            rotate_point(-L/3, -2),
-            rotate_point(-L/3, 2),
-        ]
-        pygame.draw.polygon(screen, self.accent_color, stripe_points)
+        bicycle_step_all(self.x, self.y, self.angle, self.speed, self.steering_angle,
+                         self.wheelbase)
+        self._record_trail()
+    
+    def tick(self, lane_centers, gains, base_speed):
+        """
+        Steer, slow for turns and move every car in one fused pass.
         
-        # Number badge
-        number_pos = rotate_point(-L/6, 0)
-        pygame.draw.circle(screen, WHITE, number_pos, 6)
+        lane_centers come from the vision pre-pass, gains from each car's
+        pure pursuit controller and base_speed (scalar or per car) is the
+        commanded speed. speed is written with the applied, turn-reduced speed.
+        """
+        n = len(self)
+        tick_all(self.x, self.y, self.angle, self.speed, self.steering_angle,
+                 np.asarray(lane_centers, dtype=np.float32), np.asarray(gains, dtype=np.float32),
+                 np.ascontiguousarray(np.broadcast_to(np.asarray(base_speed, dtype=np.float32), n)),
+                 self.wheelbase, MAX_STEERING_ANGLE, MIN_SPEED, MAX_SPEED)
+        self._record_trail()
+    
+    def _record_trail(self):
+        rows = np.arange(len(self))
+        self.trail[rows, self.trail_head] = np.stack((self.x, self.y, self.speed), axis=1)
+        self.trail_head += 1
+        self.trail_head %= self.max_trail
+        np.minimum(self.trail_count + 1, self.max_trail, out=self.trail_count)
+    
+    def _ordered_trail(self, i):
+        """Trail of car i, oldest to newest as an (n, 3) array"""
+        return _ordered_ring(self.trail[i], self.trail_head[i], self.trail_count[i])
+    
+    def render(self, screen):
+        """Draw every car and its trail, returning one drawn-over rect per car"""
+        colors = (self.body_color, self.accent_color, self.wing_color)
+        glow = Car._get_glow(self.body_color)
+        half = Car._SPRITE_HALF
+        half_length = self.length / 2
         
-        # Steering indicator
-        front_x, front_y = self.get_front_position()
-        steer_rad = np.radians(self.angle + self.steering_angle)
-        line_length = 20
-        end_x = front_x + line_length * np.cos(steer_rad)
-        end_y = front_y + line_length * np.sin(steer_rad)
-        pygame.draw.line(screen, ACCENT_YELLOW, 
-                        (int(front_x), int(front_y)), 
-                        (int(end_x), int(end_y)), 2)
-        pygame.draw.circle(screen, ACCENT_YELLOW, (int(end_x), int(end_y)), 4)
+        xs, ys = self.x.tolist(), self.y.tolist()
+        angles, steering = self.angle.tolist(), self.steering_angle.tolist()
+        rects = []
+        for i in range(len(self)):
+            x, y, angle = xs[i], ys[i], angles[i]
+            
+            trail_rect = None
+            if self.trail_count[i] > 1:
+                points = self._ordered_trail(i)[:, :2].astype(np.int32).tolist()
+                trail_rect = _draw_trail(screen, points, self._trail_colors, self._trail_thickness,
+                                         Car._TRAIL_BANDS)
+            
+            rect = screen.blit(glow, (int(x) - 50, int(y) - 50))
+            if trail_rect is not None:
+                rect.union_ip(trail_rect)
+            sprite = Car._get_sprite(int(round(angle)) % 360, colors)
+            rect.union_ip(screen.blit(sprite, (int(x) - half, int(y) - half)))
+            
+            heading_rad = math.radians(angle)
+            rect.union_ip(_draw_steering_indicator(screen,
+                                                   x + half_length * math.cos(heading_rad),
+                                                   y + half_length * math.sin(heading_rad),
+                                                   angle + steering[i]))
+            rects.append(rect)
+        return rects
+
+
+class CarView:
+    """Per-car view into a Cars fleet, for code written against the Car attribute API"""
+    
+    __slots__ = ('_cars', '_i')
+    
+    def __init__(self, cars, i):
+        self._cars = cars
+        self._i = i
+    
+    @property
+    def x(self):
+        return float(self._cars.x[self._i])
+    
+    @property
+    def y(self):
+        return float(self._cars.y[self._i])
+    
+    @property
+    def angle(self):
+        return float(self._cars.angle[self._i])
+    
+    @property
+    def speed(self):
+        return float(self._cars.speed[self._i])
+    
+    @speed.setter
+    def speed(self, value):
+        self._cars.speed[self._i] = value
+    
+    @property
+    def steering_angle(self):
+        return float(self._cars.steering_angle[self._i])
@@ -3,44 +3,66 @@ Vision-based Pure Pursuit controller
 Uses OpenCV for lane detection from camera view
 """
 
+import math
 import cv2
 import numpy as np
 import pygame
 from config import *
+from tick import weighted_lane_center, pure_pursuit_steering, speed_for_steering
 
 
 class VisionSystem:
     """OpenCV lane detection"""
     
+    # Structuring element for closing gaps in the boundary mask
+    _MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+    
+    # Scanline heights: 80% (close), 60% (mid), 40% (far), 30% (horizon)
+    _SCAN_ROWS = np.array([0.8, 0.6, 0.4, 0.3])
+    _SCAN_WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1])
+    
     def __init__(self):
-        # Green color range for boundary detection
-        self.green_lower = np.array([35, 80, 80])
-        self.green_upper = np.array([85, 255, 255])
+        # Boundary detection: green channel must exceed green_min and 1.5x both red and blue
+        self.green_min = 80
+        
+        # Rows of the BGR -> (2G - 3B, 2G - 3R, G - green_min) transform used by _green_mask
+        self._dominance = np.float32([
+            [-3, 2, 0, 0],
+            [0, 2, -3, 0],
+            [0, 1, 0, 0],
+        ])
         
         self.cam_width = 480
         self.cam_height = 320
         
+        # Lanes are detected on a frame downsampled by this factor
+        self.detect_scale = 2
+        small_w = self.cam_width // self.detect_scale
+        small_h = self.cam_height // self.detect_scale
+        
+        # Per-frame working buffers, reused to avoid reallocating every frame
+        self._warp_buf = np.empty((self.cam_height, self.cam_width, 3), np.uint8)
+        self._small_buf = np.empty((small_h, small_w, 3), np.uint8)
+        self._dominance_buf = np.empty_like(self._small_buf)
+        self._mask_buf = np.empty((small_h, small_w), np.uint8)
+        self._mask_full_buf = np.empty((self.cam_height, self.cam_width), np.uint8)
+        self._highlight_buf = np.empty_like(self._warp_buf)
+        self._proc_buf = np.empty_like(self._warp_buf)
+        
+        # The overlay is only for display, so it is rebuilt at a lower cadence
+        self.overlay_stride = 3
+        self._frame_idx = 0
+        
         self.lane_center = None
         self.left_boundary = None
         self.right_boundary = None
         self.camera_frame = None
         self.processed_frame = None
         
-    def get_camera_pov(self, full_frame, car_x, car_y, car_angle):
-        """
-        Extract first-person camera view from car perspective using perspective warping.
-        
-        Args:
-            full_frame: The global top-down view of the track.
-            car_x, car_y: Current car coordinates.
-            car_angle: Car heading in degrees.
-            
-        Returns:
-            Warpped OpenCV frame representing the driver's POV.
-        """
-        h, w = full_frame.shape[:2]
-        
-        heading_rad = np.radians(car_angle)
+        # BGR copy of the full track frame and the surface it was converted from.
+        # The track surface is static, so it is only converted again for a new surface.
+        self._bgr_buf = None
+        self._bgr_source = None
         
         # Perspective Trapezoid Settings
         # These define the 'field of view' in front of the car
@@ -49,107 +71,160 @@ class VisionSystem:
         near_half_width = 80   # Width of view at the front bumper
         far_half_width = 1000  # Width of view at the horizon (simulates perspective)
         
-        cos_h = np.cos(heading_rad)
-        sin_h = np.sin(heading_rad)
-        cos_perp = np.cos(heading_rad + np.pi/2)
-        sin_perp = np.sin(heading_rad + np.pi/2)
-        
-        # Define the four points of the trapezoid in global coordinates
+        # The four trapezoid corners in the car frame as (forward, right)
         # 1. Front-Left, 2. Front-Right, 3. Far-Right, 4. Far-Left
-        src_points = np.float32([
-            [car_x + near_dist * cos_h - near_half_width * cos_perp,
-             car_y + near_dist * sin_h - near_half_width * sin_perp],
-            [car_x + near_dist * cos_h + near_half_width * cos_perp,
-             car_y + near_dist * sin_h + near_half_width * sin_perp],
-            [car_x + far_dist * cos_h + far_half_width * cos_perp,
-             car_y + far_dist * sin_h + far_half_width * sin_perp],
-            [car_x + far_dist * cos_h - far_half_width * cos_perp,
-             car_y + far_dist * sin_h - far_half_width * sin_perp],
+        self._trap_local = np.float32([
+            [near_dist, -near_half_width],
+            [near_dist, near_half_width],
+            [far_dist, far_half_width],
+            [far_dist, -far_half_width],
         ])
         
-        # Map these global points to the fixed camera frame size (rectanglar)
-        dst_points = np.float32([
+        # Map these points to the fixed camera frame size (rectanglar)
+        self._dst_points = np.float32([
             [0, self.cam_height],
             [self.cam_width, self.cam_height],
             [self.cam_width, 0],
             [0, 0],
         ])
         
-        # Calculate transform and warp the image
-        matrix = cv2.getPerspectiveTransform(src_points, dst_points)
-        camera_view = cv2.warpPerspective(full_frame, matrix, (self.cam_width, self.cam_height))
+        # Car-frame -> camera homography; fixed, so computed once
+        self._M_local = cv2.getPerspectiveTransform(self._trap_local, self._dst_points)
+        
+    def get_camera_pov(self, full_frame, car_x, car_y, car_angle):
+        """
+        Extract first-person camera view from car perspective using perspective warping.
+        
+        Args:
+            full_frame: The global top-down view of the track.
+            car_x, car_y: Current car coordinates.
+            car_angle: Car heading in degrees.
+            
+        Returns:
+            Warpped OpenCV frame representing the driver's POV.
+        """
+        heading_rad = math.radians(car_angle)
+        cos_h = math.cos(heading_rad)
+        sin_h = math.sin(heading_rad)
+        
+        # Rigid transform from global coordinates into the car frame (forward, right)
+        world_to_car = np.array([
+            [cos_h, sin_h, -cos_h * car_x - sin_h * car_y],
+            [-sin_h, cos_h, sin_h * car_x - cos_h * car_y],
+            [0.0, 0.0, 1.0],
+        ])
+        
+        # Compose with the fixed car-frame homography and warp the image
+        matrix = self._M_local @ world_to_car
+        camera_view = cv2.warpPerspective(full_frame, matrix, (self.cam_width, self.cam_height),
+                                          dst=self._warp_buf)
         
         return camera_view
     
     def process_camera_view(self, camera_frame):
         """
-        Detect lane boundaries and compute center deviation using HSV thresholding.
+        Detect lane boundaries and compute center deviation using a green dominance test.
         
         Logic:
-        1. Convert to HSV and isolate the green boundary lines.
+        1. Downsample and isolate the green boundary lines straight from BGR.
         2. Scan multiple horizontal rows to find left/right boundary points.
         3. Average the centers of those rows to get a stable target path.
         """
-        hsv = cv2.cvtColor(camera_frame, cv2.COLOR_BGR2HSV)
+        # Steering only needs the normalized lane center, so detect at reduced resolution
+        small_h, small_w = self._small_buf.shape[:2]
+        small = cv2.resize(camera_frame, (small_w, small_h), dst=self._small_buf,
+                           interpolation=cv2.INTER_AREA)
         
         # Isolate green boundary pixels
-        mask = cv2.inRange(hsv, self.green_lower, self.green_upper)
+        mask = self._green_mask(small)
         
         # Morphological operations to remove noise/gaps
-        kernel = np.ones((3, 3), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._MORPH_KERNEL, dst=self._mask_buf)
         
-        # Create visual overlay for the 'Driver View' UI
-        self.processed_frame = camera_frame.copy()
-        green_highlight = np.zeros_like(camera_frame)
-        green_highlight[mask > 0] = [0, 255, 255] # Cyan glow for detected lanes
-        self.processed_frame = cv2.addWeighted(self.processed_frame, 0.7, green_highlight, 0.5, 0)
-        
-        # Find lane center at multiple rows (Scanlines)
+        # Find lane center at multiple rows (Scanlines), all scanned in one pass
         h, w = mask.shape
-        lane_centers = []
+        rows = (h * self._SCAN_ROWS).astype(np.intp)
+        rows = rows[(rows >= 0) & (rows < h)]
         
-        # Sample at 80% (close), 60% (mid), 40% (far), 30% (horizon) height
-        for row_pct in [0.8, 0.6, 0.4, 0.3]:
-            row = int(h * row_pct)
-            if row < 0 or row >= h:
-                continue
-            
-            row_data = mask[row, :]
-            green_pixels = np.where(row_data > 0)[0]
-            
-            if len(green_pixels) >= 2:
-                # Find the horizontal bounds of the lane
-                left = green_pixels.min()
-                right = green_pixels.max()
-                center = (left + right) / 2 / w # Normalize to 0-1
-                lane_centers.append(center)
-                
-                # Draw visual debug markers
-                cv2.circle(self.processed_frame, (int(center * w), row), 5, (255, 0, 255), -1) # Center point
-                cv2.circle(self.processed_frame, (left, row), 3, (0, 255, 0), -1) # Left edge
-                cv2.circle(self.processed_frame, (right, row), 3, (0, 255, 0), -1) # Right edge
+        hits = mask[rows] > 0
+        found = np.count_nonzero(hits, axis=1) >= 2
         
-        # Visual guide for true center
-        cv2.line(self.processed_frame, (w // 2, 0), (w // 2, h), (0, 100, 255), 1)
-        cv2.putText(self.processed_frame, "LANE SENSORS: ACTIVE", (10, 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        # Horizontal bounds of the lane: first and last green pixel per row
+        lefts = hits.argmax(axis=1)
+        rights = w - 1 - hits[:, ::-1].argmax(axis=1)
+        centers = (lefts + rights) / 2 / w # Normalize to 0-1
+        
+        # Only rebuild the 'Driver View' overlay every overlay_stride frames
+        if self._frame_idx % self.overlay_stride == 0:
+            self._draw_overlay(camera_frame, mask, rows[found], lefts[found], rights[found])
+        self._frame_idx += 1
         
-        if lane_centers:
+        if found.any():
             # Weighted average: prioritize closer lane information for immediate steering
-            weights = [0.4, 0.3, 0.2, 0.1][:len(lane_centers)]
-            self.lane_center = sum(c * w for c, w in zip(lane_centers, weights)) / sum(weights)
+            self.lane_center = weighted_lane_center(centers, found, self._SCAN_WEIGHTS)
             return self.lane_center
         
         # Default to center if no lanes detected
         return 0.5
     
+    def _green_mask(self, frame):
+        """
+        255 where G > green_min and G > 1.5 * R and G > 1.5 * B, else 0.
+        
+        Tests the BGR channels directly instead of converting to HSV. One
+        cv2.transform pass computes 2G - 3B, 2G - 3R and G - green_min per
+        pixel; uint8 saturation clamps negatives to 0, so a pixel is green
+        exactly when all three results are positive.
+        """
+        self._dominance[2, 3] = -self.green_min
+        cv2.transform(frame, self._dominance, dst=self._dominance_buf)
+        return cv2.inRange(self._dominance_buf, (1, 1, 1), (255, 255, 255), dst=self._mask_buf)
+    
+    def _draw_overlay(self, camera_frame, mask, rows, lefts, rights):
+        """Build processed_frame: camera view with detected lanes and scanline markers"""
+        h, w = camera_frame.shape[:2]
+        
+        # Detection ran downsampled - bring the mask and scan positions back to full size
+        mask = cv2.resize(mask, (w, h), dst=self._mask_full_buf, interpolation=cv2.INTER_NEAREST)
+        scale = self.detect_scale
+        rows, lefts, rights = rows * scale, lefts * scale, rights * scale
+        
+        green_highlight = self._highlight_buf
+        green_highlight[...] = 0
+        green_highlight[mask > 0] = [0, 255, 255] # Cyan glow for detected lanes
+        self.processed_frame = cv2.addWeighted(camera_frame, 0.7, green_highlight, 0.5, 0,
+                                               dst=self._proc_buf)
+        
+        for row, left, right in zip(rows.tolist(), lefts.tolist(), rights.tolist()):
+            center = (left + right) / 2
+            
+            # Draw visual debug markers
+            cv2.circle(self.processed_frame, (int(center), row), 5, (255, 0, 255), -1) # Center point
+            cv2.circle(self.processed_frame, (left, row), 3, (0, 255, 0), -1) # Left edge
+            cv2.circle(self.processed_frame, (right, row), 3, (0, 255, 0), -1) # Right edge
+        
+        # Visual guide for true center
+        cv2.line(self.processed_frame, (w // 2, 0), (w // 2, h), (0, 100, 255), 1)
+        cv2.putText(self.processed_frame, "LANE SENSORS: ACTIVE", (10, 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    
     def process_frame(self, pygame_surface, car_x, car_y, car_angle):
-        """Full pipeline: get camera view and process lanes"""
-        # Convert pygame to OpenCV format
-        frame = pygame.surfarray.array3d(pygame_surface)
-        frame = np.transpose(frame, (1, 0, 2))
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        """
+        Full pipeline: get camera view and process lanes.
+        
+        pygame_surface is treated as static and only read again when a
+        different surface object is passed in.
+        """
+        # Convert pygame to OpenCV format once per surface - row-major RGB bytes,
+        # swapped into a reused BGR buffer
+        if pygame_surface is not self._bgr_source:
+            w, h = pygame_surface.get_size()
+            rgb = np.frombuffer(pygame.image.tobytes(pygame_surface, "RGB"), np.uint8).reshape(h, w, 3)
+            if self._bgr_buf is None or self._bgr_buf.shape != rgb.shape:
+                self._bgr_buf = np.empty_like(rgb)
+            cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=self._bgr_buf)
+            self._bgr_source = pygame_surface
+        frame = self._bgr_buf
         
         self.camera_frame = self.get_camera_pov(frame, car_x, car_y, car_angle)
         lane_center = self.process_camera_view(self.camera_frame)
@@ -166,37 +241,47 @@ class VisionSystem:
 class VisionPurePursuit:
     """Vision-based Pure Pursuit controller"""
     
+    # Steering gain numerator, divided by the look-ahead distance
+    GAIN_CONSTANT = 3000.0
+    
     def __init__(self, look_ahead_distance=LOOK_AHEAD_DISTANCE):
         self.look_ahead_distance = look_ahead_distance
         self.vision = VisionSystem()
         self.lane_center = 0.5
         self.steering_error = 0
         self.viz_lookahead_point = None
+    
+    @property
+    def look_ahead_distance(self):
+        return self._look_ahead_distance
+    
+    @look_ahead_distance.setter
+    def look_ahead_distance(self, value):
+        # Derived values are refreshed here rather than on every steering call
+        self._look_ahead_distance = value
+        self._gain = self.GAIN_CONSTANT / max(value, 1.0)
+        self._look_dist = value * 4
         
     def calculate_steering(self, car, pygame_surface):
         """Calculate steering from vision"""
-        self.lane_center = self.vision.process_frame(
-            pygame_surface, car.x, car.y, car.angle
-        )
+        # Bind car attributes used more than once to locals
+        car_x, car_y, car_angle = car.x, car.y, car.angle
+        look_dist = self._look_dist
         
-        # Visualization point
-        heading_rad = np.radians(car.angle)
-        look_dist = self.look_ahead_distance * 4
-        steering_rad = np.radians(car.steering_angle)
+        lane_center = self.vision.process_frame(pygame_surface, car_x, car_y, car_angle)
+        self.lane_center = lane_center
         
-        lx = car.x + look_dist * np.cos(heading_rad + steering_rad)
-        ly = car.y + look_dist * np.sin(heading_rad + steering_rad)
+        # Visualization point
+        view_rad = math.radians(car_angle + car.steering_angle)
+        lx = car_x + look_dist * math.cos(view_rad)
+        ly = car_y + look_dist * math.sin(view_rad)
         self.viz_lookahead_point = (lx, ly)
         
         # Steering error from center
-        self.steering_error = self.lane_center - 0.5
+        self.steering_error = lane_center - 0.5
         
         # Pure pursuit steering
-        GAIN_CONSTANT = 3000
-        safe_look_ahead = max(self.look_ahead_distance, 1.0)
-        steering = self.steering_error * (GAIN_CONSTANT / safe_look_ahead)
-        
-        return np.clip(steering, -MAX_STEERING_ANGLE, MAX_STEERING_ANGLE)
+        return pure_pursuit_steering(lane_center, self._gain, MAX_STEERING_ANGLE)
     
     def get_camera_view(self):
         """Get camera frame for display"""
@@ -214,5 +299,4 @@ class SpeedController:
         
     def calculate_speed(self, steering_angle, base_speed):
         """Reduce speed based on steering angle"""
-        steering_factor = 1 - (abs(steering_angle) / MAX_STEERING_ANGLE) * 0.4
-        return base_speed * max(steering_factor, 0.5)
+        return speed_for_steering(steering_angle, base_speed, MAX_STEERING_ANGLE)
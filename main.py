@@ -5,18 +5,29 @@ Pure Pursuit controller with first-person POV camera view
 """
 
 import pygame
+import pygame.gfxdraw
 import cv2
 import numpy as np
 import sys
+from functools import lru_cache
 from config import *
 from track import Track
 from car import Car
 from controllers import VisionPurePursuit, SpeedController
 
 
+@lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Cached antialiased font render - labels and repeated values skip rasterizing"""
+    return font.render(text, True, color)
+
+
 class Slider:
     """Interactive slider widget"""
     
+    # The only event types a slider reacts to
+    EVENT_TYPES = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION))
+    
     def __init__(self, x, y, width, min_val, max_val, initial, label, color=ACCENT_CYAN):
         self.x = x
         self.y = y
@@ -30,35 +41,55 @@ class Slider:
         self.dragging = False
         self.knob_radius = 10
         
+        # Text surfaces, re-rendered only when the font, string or color changes
+        self._label_font = None
+        self._label_surf = None
+        self._last_value_key = None
+        self._last_value_surf = None
+    
     def get_knob_x(self):
         ratio = (self.value - self.min_val) / (self.max_val - self.min_val)
         return self.x + int(ratio * self.width)
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type not in self.EVENT_TYPES:
+            return
+        if event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                self._update_value(event.pos[0])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             mx, my = event.pos
             if (self.x <= mx <= self.x + self.width and 
                 self.y - 5 <= my <= self.y + self.height + 5):
                 self.dragging = True
                 self._update_value(mx)
-        elif event.type == pygame.MOUSEBUTTONUP:
+        else:
             self.dragging = False
-        elif event.type == pygame.MOUSEMOTION and self.dragging:
-            self._update_value(event.pos[0])
     
     def _update_value(self, mx):
         mx = max(self.x, min(mx, self.x + self.width))
         ratio = (mx - self.x) / self.width
         self.value = self.min_val + ratio * (self.max_val - self.min_val)
     
-    def render(self, screen, font):
-        # Label and value
-        label_surface = font.render(self.label, True, (120, 125, 135))
-        screen.blit(label_surface, (self.x, self.y - 18))
+    def render(self, screen, font, blit_list=None):
+        # Label and value - queued on blit_list when batching
+        if font is not self._label_font:
+            self._label_surf = render_text(font, self.label, (120, 125, 135))
+            self._label_font = font
+        label_surface = self._label_surf
         
         value_str = f"{self.value:.1f}" if isinstance(self.value, float) else f"{int(self.value)}"
-        value_surface = font.render(value_str, True, self.color)
-        screen.blit(value_surface, (self.x + self.width - value_surface.get_width(), self.y - 18))
+        value_key = (font, value_str, self.color)
+        if value_key != self._last_value_key:
+            self._last_value_surf = render_text(font, value_str, self.color)
+            self._last_value_key = value_key
+        value_surface = self._last_value_surf
+        text_blits = [(label_surface, (self.x, self.y - 18)),
+                      (value_surface, (self.x + self.width - value_surface.get_width(), self.y - 18))]
+        if blit_list is None:
+            screen.blits(text_blits, doreturn=0)
+        else:
+            blit_list.extend(text_blits)
         
         # Track
         track_y = self.y + self.height // 2 - 3
@@ -90,22 +121,103 @@ class ModernUI:
         self.speed_slider = Slider(WINDOW_WIDTH - 200, 250, 160, 1.0, 50.0, 5.0, "SPEED", ACCENT_GREEN)
         self.lookahead_slider = Slider(WINDOW_WIDTH - 200, 320, 160, 20, 150, 60, "LOOK-AHEAD", ACCENT_YELLOW)
         
-    def draw_panel(self, x, y, width, height, title=None):
+        # Telemetry panel column, right-aligned to the window
+        self.telemetry_x = WINDOW_WIDTH - 220
+        self.stat_x = WINDOW_WIDTH - 200
+        
+        # Static chrome, drawn once and blitted every frame
+        self._panel_cache = {}
+        
+        # "VISION-BASED" badge at top
+        self._vision_badge = self._build_badge(220, 35, (*ACCENT_GREEN, 200), 17, "VISION-BASED",
+                                               self.font_medium, WHITE, border=ACCENT_GREEN)
+        self._vision_badge_pos = (WINDOW_WIDTH // 2 - 220 // 2, 15)
+        
+        # Mode badge
+        self._mode_badge = self._build_badge(180, 30, (40, 45, 55, 200), 15, "Pure Pursuit Controller",
+                                             self.font_small, (150, 155, 165))
+        self._mode_badge_pos = (WINDOW_WIDTH // 2 - 180 // 2, 55)
+        
+        # Hint bar
+        self._hint_panel = pygame.Surface((350, 35), pygame.SRCALPHA)
+        pygame.draw.rect(self._hint_panel, (15, 15, 25, 200), (0, 0, 350, 35), border_radius=8)
+        hint = "[R] Reset    [SPACE] Pause    [ESC] Quit"
+        hint_surf = self.font_small.render(hint, True, (120, 125, 135))
+        self._hint_panel.blit(hint_surf, (175 - hint_surf.get_width() // 2, 10))
+        self._hint_panel = self._hint_panel.convert_alpha()
+        self._hint_pos = (WINDOW_WIDTH // 2 - 175, WINDOW_HEIGHT - 50)
+        
+        # Screen area covered by the chrome, for dirty-rect updates
+        self._chrome_rects = [self._vision_badge.get_rect(topleft=self._vision_badge_pos),
+                              self._mode_badge.get_rect(topleft=self._mode_badge_pos),
+                              self._hint_panel.get_rect(topleft=self._hint_pos)]
+        
+        # Paused dimming overlay
+        self._pause_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 100))
+        self._pause_overlay = self._pause_overlay.convert_alpha()
+        self._pause_text = pygame.font.Font(None, 72).render("PAUSED", True, WHITE).convert_alpha()
+        
+        # Driver view buffers, allocated on the first frame
+        self._cam_src_shape = None
+    
+    def _build_badge(self, width, height, fill, radius, text, font, text_color, border=None):
+        """Draw a rounded badge with centered text onto its own alpha surface"""
+        badge = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(badge, fill, (0, 0, width, height), border_radius=radius)
+        if border:
+            pygame.draw.rect(badge, border, (0, 0, width, height), 2, border_radius=radius)
+        
+        text_surface = font.render(text, True, text_color)
+        badge.blit(text_surface, ((width - text_surface.get_width()) // 2,
+                                  (height - text_surface.get_height()) // 2))
+        return badge.convert_alpha()
+    
+    def _build_panel(self, width, height, title=None):
         panel = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.rect(panel, (15, 15, 25, 230), (0, 0, width, height), border_radius=12)
         pygame.draw.rect(panel, (60, 65, 80), (0, 0, width, height), 2, border_radius=12)
         pygame.draw.line(panel, ACCENT_BLUE, (15, 3), (width - 15, 3), 2)
-        self.screen.blit(panel, (x, y))
         
         if title:
             title_surface = self.font_medium.render(title, True, (150, 155, 165))
-            self.screen.blit(title_surface, (x + 15, y + 12))
+            panel.blit(title_surface, (15, 12))
+        return panel.convert_alpha()
+    
+    def draw_panel(self, x, y, width, height, title=None):
+        key = (width, height, title)
+        panel = self._panel_cache.get(key)
+        if panel is None:
+            panel = self._build_panel(width, height, title)
+            self._panel_cache[key] = panel
+        return self.screen.blit(panel, (x, y))
+    
+    def draw_badges(self, blit_list=None):
+        """Draw the title badges and the key hint bar, returning their screen rects"""
+        badge_blits = [(self._vision_badge, self._vision_badge_pos),
+                       (self._mode_badge, self._mode_badge_pos),
+                       (self._hint_panel, self._hint_pos)]
+        if blit_list is None:
+            self.screen.blits(badge_blits, doreturn=0)
+        else:
+            blit_list.extend(badge_blits)
+        return self._chrome_rects
     
-    def draw_stat(self, x, y, label, value, value_color=ACCENT_CYAN):
-        label_surface = self.font_small.render(label, True, (120, 125, 135))
-        value_surface = self.font_medium.render(str(value), True, value_color)
-        self.screen.blit(label_surface, (x, y))
-        self.screen.blit(value_surface, (x, y + 18))
+    def draw_paused(self):
+        rect = self.screen.blit(self._pause_overlay, (0, 0))
+        
+        self.screen.blit(self._pause_text,
+                         self._pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)))
+        return rect
+    
+    def draw_stat(self, x, y, label, value, value_color=ACCENT_CYAN, blit_list=None):
+        label_surface = render_text(self.font_small, label, (120, 125, 135))
+        value_surface = render_text(self.font_medium, str(value), value_color)
+        stat_blits = [(label_surface, (x, y)), (value_surface, (x, y + 18))]
+        if blit_list is None:
+            self.screen.blits(stat_blits, doreturn=0)
+        else:
+            blit_list.extend(stat_blits)
     
     def draw_steering_indicator(self, x, y, angle, max_angle):
         width, height = 140, 30
@@ -122,33 +234,39 @@ class ModernUI:
         pygame.draw.circle(self.screen, WHITE, (indicator_x, y + height // 2), 8, 2)
     
     def draw_camera_view(self, x, y, cv_frame):
-        """Draw the camera POV in a panel"""
+        """Draw the camera POV in a panel, returning the panel rect"""
         if cv_frame is None:
-            return
-        
-        # Convert BGR to RGB
-        cv_frame = cv2.cvtColor(cv_frame, cv2.COLOR_BGR2RGB)
-        
-        # Scale down for display (smaller box requested)
-        scale = 0.7
-        org_h, org_w = cv_frame.shape[:2]
-        new_w = int(org_w * scale)
-        new_h = int(org_h * scale)
+            return None
+        
+        # Display size and buffers only depend on the (constant) camera size
+        if self._cam_src_shape != cv_frame.shape:
+            # Scale down for display (smaller box requested)
+            scale = 0.7
+            org_h, org_w = cv_frame.shape[:2]
+            self._cam_size = (int(org_w * scale), int(org_h * scale))
+            self._cam_resized = np.empty((self._cam_size[1], self._cam_size[0], 3), np.uint8)
+            self._cam_rgb = np.empty_like(self._cam_resized)
+            
+            # The surface shares _cam_rgb's memory, so it shows whatever
+            # cvtColor last wrote there - no per-frame surface
+            self._cam_surface = pygame.image.frombuffer(self._cam_rgb, self._cam_size, "RGB")
+            self._cam_src_shape = cv_frame.shape
+        new_w, new_h = self._cam_size
         
-        # Resize frame
-        resized_frame = cv2.resize(cv_frame, (new_w, new_h))
+        # Resize first so the color conversion runs on the smaller image
+        cv2.resize(cv_frame, (new_w, new_h), dst=self._cam_resized)
+        cv2.cvtColor(self._cam_resized, cv2.COLOR_BGR2RGB, dst=self._cam_rgb)
         
         # Panel
         panel_w, panel_h = new_w + 20, new_h + 45
-        self.draw_panel(x, y, panel_w, panel_h, "DRIVER VIEW")
+        panel_rect = self.draw_panel(x, y, panel_w, panel_h, "DRIVER VIEW")
         
-        # Convert to pygame surface
-        pygame_frame = pygame.surfarray.make_surface(np.transpose(resized_frame, (1, 0, 2)))
-        self.screen.blit(pygame_frame, (x + 10, y + 35))
+        self.screen.blit(self._cam_surface, (x + 10, y + 35))
         
         # Border with glow effect
         pygame.draw.rect(self.screen, ACCENT_CYAN, (x + 10, y + 35, new_w, new_h), 2)
         pygame.draw.rect(self.screen, (*ACCENT_CYAN, 50), (x + 8, y + 33, new_w + 4, new_h + 4), 1)
+        return panel_rect
 
 
 class Simulation:
@@ -166,6 +284,7 @@ class Simulation:
         # Track (just for rendering - controller doesn't use it!)
         self.track = Track()
         start_x, start_y, start_angle = self.track.get_start_position()
+        self._start_x, self._start_y = start_x, start_y
         self.car = Car(start_x, start_y, start_angle)
         
         # Vision-based Pure Pursuit controller
@@ -177,175 +296,226 @@ class Simulation:
         self.paused = False
         self.lap_count = 0
         self.lap_ready = False
-        self.last_start_dist = 0
+        self.last_start_dist2 = 0
         
-        # Track surface for vision processing
-        self.track_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Track surface for vision processing - the track is static, so it is
+        # rendered once and reused as the display background too
+        self.track_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.track_surface.fill(GRASS_GREEN)
+        self.track.render(self.track_surface)
         
+        # Dirty-rect rendering: screen areas drawn last frame, restored from
+        # track_surface before the next one. The first frame covers everything.
+        self._dirty_rects = [self.screen.get_rect()]
+        self._ui_dirty = False
+        self._paused_drawn = False
+        
+        # Event and key dispatch tables
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_key,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.WINDOWEXPOSED: self._on_expose,
+            pygame.VIDEOEXPOSE: self._on_expose,
+        }
+        self._sliders = (self.ui.speed_slider, self.ui.lookahead_slider)
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._quit,
+            pygame.K_SPACE: self._toggle_pause,
+            pygame.K_r: self.reset,
+        }
+    
+    def _quit(self):
+        self.running = False
+    
+    def _toggle_pause(self):
+        self.paused = not self.paused
+    
+    def _on_quit(self, event):
+        self._quit()
+    
+    def _on_key(self, event):
+        handler = self._key_handlers.get(event.key)
+        if handler:
+            handler()
+            self._ui_dirty = True
+    
+    def _on_mouse_button(self, event):
+        for slider in self._sliders:
+            before = (slider.dragging, slider.value)
+            slider.handle_event(event)
+            if (slider.dragging, slider.value) != before:
+                self._ui_dirty = True
+    
+    def _on_mouse_motion(self, event):
+        # Motion only matters to a slider being dragged
+        for slider in self._sliders:
+            if slider.dragging:
+                slider.handle_event(event)
+                self._ui_dirty = True
+    
+    def _on_expose(self, event):
+        # The window contents were lost - push the whole screen next frame
+        self._dirty_rects = [self.screen.get_rect()]
+        self._ui_dirty = True
+    
     def handle_events(self):
+        # Handlers set _ui_dirty when they change what a paused frame shows
+        event_handlers = self._event_handlers
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            self.ui.speed_slider.handle_event(event)
-            self.ui.lookahead_slider.handle_event(event)
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_SPACE:
-                    self.paused = not self.paused
-                elif event.key == pygame.K_r:
-                    self.reset()
-        
-        # Apply slider values
+            handler = event_handlers.get(event.type)
+            if handler:
+                handler(event)
+        
+        # Apply slider values - the look-ahead setter recomputes the gain, so only on change
         self.car.speed = self.ui.speed_slider.value
-        self.controller.look_ahead_distance = self.ui.lookahead_slider.value
+        look_ahead = self.ui.lookahead_slider.value
+        if look_ahead != self.controller.look_ahead_distance:
+            self.controller.look_ahead_distance = look_ahead
     
     def reset(self):
         start_x, start_y, start_angle = self.track.get_start_position()
+        self._start_x, self._start_y = start_x, start_y
         self.car = Car(start_x, start_y, start_angle)
         self.lap_count = 0
         self.lap_ready = False
-        self.last_start_dist = 0
+        self.last_start_dist2 = 0
     
     def update(self):
         if self.paused:
             return
         
-        # Render track only (for vision processing)
-        self.track_surface.fill(GRASS_GREEN)
-        self.track.render(self.track_surface)
+        car = self.car
         
         # Get steering from VISION-BASED controller
-        steering = self.controller.calculate_steering(self.car, self.track_surface)
+        steering = self.controller.calculate_steering(car, self.track_surface)
         
         # Get speed (reduces in turns)
-        speed = self.speed_controller.calculate_speed(steering, self.car.speed)
+        speed = self.speed_controller.calculate_speed(steering, car.speed)
         
         # Update car
-        self.car.update(steering, speed)
+        car.update(steering, speed)
         
-        # Lap detection
-        start_x, start_y, _ = self.track.get_start_position()
-        dist_to_start = np.sqrt((self.car.x - start_x)**2 + (self.car.y - start_y)**2)
+        # Lap detection - squared distance against squared thresholds, no sqrt
+        dx = car.x - self._start_x
+        dy = car.y - self._start_y
+        dist2_to_start = dx * dx + dy * dy
         
         # Robust lap counting: must travel far (lap_ready) then return
-        if dist_to_start > 400:
+        if dist2_to_start > 400 * 400:
             self.lap_ready = True
-            
-        if self.lap_ready and dist_to_start < 60:
+        
+        if self.lap_ready and dist2_to_start < 60 * 60:
             self.lap_count += 1
             self.lap_ready = False
-            
-        self.last_start_dist = dist_to_start
+        
+        self.last_start_dist2 = dist2_to_start
     
     def render(self):
-        # Draw track
-        self.track.render(self.screen)
+        # Nothing moves while paused - only redraw in response to input
+        if self.paused and self._paused_drawn and not self._ui_dirty:
+            return
+        self._ui_dirty = False
+        self._paused_drawn = self.paused
+        
+        # Restore the track only where the previous frame drew
+        screen = self.screen
+        track_surface = self.track_surface
+        for rect in self._dirty_rects:
+            screen.blit(track_surface, rect, rect)
         
         # Draw vision visualization (yellow lines)
-        self._draw_vision_viz()
+        rects = self._draw_vision_viz()
         
         # Draw car
-        self.car.render(self.screen)
+        rects.append(self.car.render(screen))
         
         # Draw UI
-        self._draw_ui()
-        
-        pygame.display.flip()
+        rects.extend(self._draw_ui())
         
+        # Push the erased and the newly drawn areas
+        pygame.display.update(self._dirty_rects + rects)
+        self._dirty_rects = rects
+    
     def _draw_vision_viz(self):
-        """Draw what the vision system detects"""
+        """Draw what the vision system detects, returning the drawn screen rects"""
         controller = self.controller
+        rects = []
         
         # Draw lookahead line/point
         if hasattr(controller, 'viz_lookahead_point') and controller.viz_lookahead_point:
+            screen = self.screen
             lx, ly = controller.viz_lookahead_point
+            lookahead = (int(lx), int(ly))
+            car_pos = (int(self.car.x), int(self.car.y))
             
             # Yellow line from car to lookahead point
-            pygame.draw.line(self.screen, (*ACCENT_YELLOW, 150),
-                           (int(self.car.x), int(self.car.y)),
-                           (int(lx), int(ly)), 2)
+            rects.append(pygame.draw.line(screen, (*ACCENT_YELLOW, 150), car_pos, lookahead, 2))
             
             # Look-ahead circle
-            pygame.draw.circle(self.screen, ACCENT_YELLOW, (int(lx), int(ly)), 5)
+            rects.append(pygame.draw.circle(screen, ACCENT_YELLOW, lookahead, 5))
             
             # Visual ring indicating lookahead distance scale
             # We scale this ring based on the slider value to show "extension"
             # Using look_ahead_distance directly for visualization scale
             ring_radius = int(controller.look_ahead_distance * 4) 
-            pygame.draw.circle(self.screen, (*ACCENT_YELLOW, 50),
-                             (int(self.car.x), int(self.car.y)),
-                             ring_radius, 1)
+            # gfxdraw blends the translucent outline per pixel, straight onto the screen
+            cx, cy = car_pos
+            pygame.gfxdraw.circle(screen, cx, cy, ring_radius, (*ACCENT_YELLOW, 50))
+            rects.append(pygame.Rect(cx - ring_radius, cy - ring_radius,
+                                     2 * ring_radius + 1, 2 * ring_radius + 1))
+        return rects
     
     def _draw_ui(self):
+        """Draw the UI overlay, returning the drawn screen rects"""
+        ui = self.ui
+        screen = self.screen
+        controller = self.controller
+        steering_angle = self.car.steering_angle
+        stat_x = ui.stat_x
+        rects = []
+        
         # Driver view camera (Top Left)
-        camera_frame = self.controller.get_camera_view()
-        self.ui.draw_camera_view(20, 20, camera_frame)
+        camera_rect = ui.draw_camera_view(20, 20, controller.get_camera_view())
+        if camera_rect is not None:
+            rects.append(camera_rect)
+        
+        # Controls panel (top right) - the stats and sliders all sit inside it
+        rects.append(ui.draw_panel(ui.telemetry_x, 20, 200, 360, "TELEMETRY"))
         
-        # Controls panel (top right)
-        self.ui.draw_panel(WINDOW_WIDTH - 220, 20, 200, 360, "TELEMETRY")
+        # Text and cached chrome are queued and blitted in one batch at the end,
+        # after the shape primitives they sit next to (none of them overlap)
+        blit_list = []
         
         # Lap counter
-        self.ui.draw_stat(WINDOW_WIDTH - 200, 55, "LAPS", str(self.lap_count), ACCENT_CYAN)
+        ui.draw_stat(stat_x, 55, "LAPS", str(self.lap_count), ACCENT_CYAN, blit_list)
         
         # Steering display
-        self.ui.draw_stat(WINDOW_WIDTH - 200, 100, "STEERING", f"{self.car.steering_angle:.1f}°", ACCENT_YELLOW)
-        self.ui.draw_steering_indicator(WINDOW_WIDTH - 200, 140, self.car.steering_angle, MAX_STEERING_ANGLE)
+        ui.draw_stat(stat_x, 100, "STEERING", f"{steering_angle:.1f}°", ACCENT_YELLOW, blit_list)
+        ui.draw_steering_indicator(stat_x, 140, steering_angle, MAX_STEERING_ANGLE)
         
         # Lane position indicator
-        lane_offset = (self.controller.lane_center - 0.5) * 100
+        lane_offset = (controller.lane_center - 0.5) * 100
         direction = "LEFT" if lane_offset < -5 else "RIGHT" if lane_offset > 5 else "CENTER"
         color = ACCENT_GREEN if direction == "CENTER" else ACCENT_YELLOW
-        self.ui.draw_stat(WINDOW_WIDTH - 200, 185, "LANE", direction, color)
+        ui.draw_stat(stat_x, 185, "LANE", direction, color, blit_list)
         
         # Sliders
-        self.ui.speed_slider.render(self.screen, self.ui.font_small)
-        self.ui.lookahead_slider.render(self.screen, self.ui.font_small)
+        ui.speed_slider.render(screen, ui.font_small, blit_list)
+        ui.lookahead_slider.render(screen, ui.font_small, blit_list)
         
-        # "VISION-BASED" badge at top
-        badge_w, badge_h = 220, 35
-        badge_x = WINDOW_WIDTH // 2 - badge_w // 2
-        badge_y = 15
-        badge = pygame.Surface((badge_w, badge_h), pygame.SRCALPHA)
-        pygame.draw.rect(badge, (*ACCENT_GREEN, 200), (0, 0, badge_w, badge_h), border_radius=17)
-        pygame.draw.rect(badge, ACCENT_GREEN, (0, 0, badge_w, badge_h), 2, border_radius=17)
-        self.screen.blit(badge, (badge_x, badge_y))
-        
-        badge_text = self.ui.font_medium.render("VISION-BASED", True, WHITE)
-        self.screen.blit(badge_text, (badge_x + (badge_w - badge_text.get_width()) // 2, 
-                                       badge_y + (badge_h - badge_text.get_height()) // 2))
+        # Badges and hint bar
+        rects.extend(ui.draw_badges(blit_list))
         
-        # Mode badge
-        mode_w, mode_h = 180, 30
-        mode_x = WINDOW_WIDTH // 2 - mode_w // 2
-        mode_y = 55
-        mode_badge = pygame.Surface((mode_w, mode_h), pygame.SRCALPHA)
-        pygame.draw.rect(mode_badge, (40, 45, 55, 200), (0, 0, mode_w, mode_h), border_radius=15)
-        self.screen.blit(mode_badge, (mode_x, mode_y))
-        
-        mode_text = self.ui.font_small.render("Pure Pursuit Controller", True, (150, 155, 165))
-        self.screen.blit(mode_text, (mode_x + (mode_w - mode_text.get_width()) // 2,
-                                     mode_y + (mode_h - mode_text.get_height()) // 2))
-        
-        # Hint bar
-        hint_panel = pygame.Surface((350, 35), pygame.SRCALPHA)
-        pygame.draw.rect(hint_panel, (15, 15, 25, 200), (0, 0, 350, 35), border_radius=8)
-        self.screen.blit(hint_panel, (WINDOW_WIDTH // 2 - 175, WINDOW_HEIGHT - 50))
-        
-        hint = "[R] Reset    [SPACE] Pause    [ESC] Quit"
-        hint_surf = pygame.font.Font(None, 22).render(hint, True, (120, 125, 135))
-        self.screen.blit(hint_surf, (WINDOW_WIDTH // 2 - hint_surf.get_width() // 2, WINDOW_HEIGHT - 40))
+        screen.blits(blit_list, doreturn=0)
         
         # Paused overlay
         if self.paused:
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(overlay, (0, 0, 0, 100), (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
-            self.screen.blit(overlay, (0, 0))
-            
-            pause_text = pygame.font.Font(None, 72).render("PAUSED", True, WHITE)
-            self.screen.blit(pause_text, pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)))
+            rects.append(ui.draw_paused())
+        
+        return rects
     
     def run(self):
         print("\n" + "=" * 60)
@@ -0,0 +1,39 @@
+"""
+Fleet tick check - Cars(1).tick must drive like Car.update with the single-car controllers
+"""
+
+import math
+import numpy as np
+from config import *
+from car import Car, Cars
+from controllers import SpeedController
+from tick import pure_pursuit_steering
+
+
+def test_single_car_fleet_matches_car():
+    x, y, angle = 700.0, 250.0, 0.0
+    base_speed = 5.0
+    gain = 3000.0 / LOOK_AHEAD_DISTANCE
+    
+    car = Car(x, y, angle)
+    speed_controller = SpeedController()
+    cars = Cars(1, x, y, angle)
+    
+    for i in range(200):
+        # Swing the lane center through both turns and the straight
+        lane_center = 0.5 + 0.4 * math.sin(i / 15)
+        
+        steering = pure_pursuit_steering(lane_center, gain, MAX_STEERING_ANGLE)
+        car.update(steering, speed_controller.calculate_speed(steering, base_speed))
+        cars.tick([lane_center], [gain], base_speed)
+        
+        # Fleet state is float32, so allow for rounding drift
+        view = cars[0]
+        assert abs(view.speed - car.speed) < 1e-4
+        assert abs(view.steering_angle - car.steering_angle) < 1e-3
+        assert abs(view.x - car.x) < 0.05
+        assert abs(view.y - car.y) < 0.05
+        assert abs((view.angle - car.angle + 180) % 360 - 180) < 0.01
+    
+    # Trails record the same path
+    assert np.allclose(cars._ordered_trail(0), car._ordered_trail(), atol=0.05)
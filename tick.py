@@ -0,0 +1,111 @@
+"""
+Numeric simulation tick - physics and control kernels, JIT-compiled when numba is available
+"""
+
+import math
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+
+@njit(cache=True, fastmath=True)
+def bicycle_step(x, y, angle, speed, steering, wheelbase):
+    """Advance one tick of the kinematic bicycle model, angles in degrees.
+    
+    The returned heading is wrapped to [-180, 180).
+    """
+    heading_rad = math.radians(angle)
+    steering_rad = math.radians(steering)
+    
+    # Formula: w = v / R, where R = wheelbase / tan(steering)
+    if abs(steering) > 0.1:
+        angular_velocity = speed * math.tan(steering_rad) / wheelbase
+    else:
+        angular_velocity = 0.0
+    
+    angle = angle + math.degrees(angular_velocity)
+    
+    # Branchless wrap - constant time however large the turn
+    angle = (angle + 180.0) % 360.0 - 180.0
+    
+    return (x + speed * math.cos(heading_rad),
+            y + speed * math.sin(heading_rad),
+            angle)
+
+
+@njit(cache=True)
+def weighted_lane_center(centers, found, weights):
+    """Weighted average of the detected scanline centers, 0.5 when none were found.
+    
+    Weights are taken in order for the rows that were found, so the closest
+    detected row always gets the largest weight.
+    """
+    total = 0.0
+    weight_sum = 0.0
+    k = 0
+    for i in range(centers.shape[0]):
+        if found[i]:
+            total += centers[i] * weights[k]
+            weight_sum += weights[k]
+            k += 1
+    if k == 0:
+        return 0.5
+    return total / weight_sum
+
+
+# The one-line control laws stay plain Python for per-call use - a numba
+# dispatch costs more than the math. The JIT copies are only for tick_all.
+
+def pure_pursuit_steering(lane_center, gain, max_steering):
+    """Steering angle from normalized lane center deviation"""
+    steering = (lane_center - 0.5) * gain
+    return max(-max_steering, min(max_steering, steering))
+
+
+def speed_for_steering(steering, base_speed, max_steering):
+    """Reduce speed based on steering angle"""
+    steering_factor = 1 - (abs(steering) / max_steering) * 0.4
+    return base_speed * max(steering_factor, 0.5)
+
+
+_pure_pursuit_steering_jit = njit(cache=True, fastmath=True)(pure_pursuit_steering)
+_speed_for_steering_jit = njit(cache=True, fastmath=True)(speed_for_steering)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def bicycle_step_all(x, y, angle, speed, steering, wheelbase):
+    """Advance every vehicle one bicycle-model tick, updating the x, y and angle arrays in place"""
+    for i in prange(x.shape[0]):
+        x[i], y[i], angle[i] = bicycle_step(x[i], y[i], angle[i], speed[i], steering[i], wheelbase)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def tick_all(x, y, angle, speed, steering, lane_centers, gains, base_speed,
+             wheelbase, max_steering, min_speed, max_speed):
+    """
+    Advance every vehicle one tick: pure pursuit steering, speed reduction
+    and the bicycle step, fused into a single pass.
+    
+    Args:
+        x, y, angle: Per-vehicle pose arrays, updated in place.
+        speed, steering: Per-vehicle outputs, the applied speed and steering angle.
+        lane_centers: Normalized lane center per vehicle from the vision pre-pass.
+        gains: Pure pursuit gain per vehicle.
+        base_speed: Commanded speed per vehicle, before the turn reduction.
+    """
+    for i in prange(x.shape[0]):
+        steer = _pure_pursuit_steering_jit(lane_centers[i], gains[i], max_steering)
+        v = _speed_for_steering_jit(steer, base_speed[i], max_steering)
+        v = max(min_speed, min(max_speed, v))
+        
+        x[i], y[i], angle[i] = bicycle_step(x[i], y[i], angle[i], v, steer, wheelbase)
+        speed[i] = v
+        steering[i] = steer